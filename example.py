@@ -28,6 +28,7 @@ Usage:
 ------
     python parse.py -i example_dat/afiro.mps
     python parse.py -i example_dat/afiro.mps -o afiro.json
+    python parse.py -i example_dat/afiro.mps -o afiro.json --compact
     python parse.py -i example_dat/afiro.mps --summarize
     python parse.py -i example_dat/afiro.mps --fill --verbose
     python parse.py -i example_dat/afiro.mps -o afiro_dual.mps --dual
@@ -99,11 +100,123 @@ __summary__ = "Example for using pymps"
 
 import argparse
 import json
+import sys
+from array import array
+from itertools import repeat
+from typing import NamedTuple, Optional
 import numpy as np
-from numpy import array, inf
+from numpy import inf
+from scipy.sparse import csr_matrix
 from pymps import parse_mps, summarize, make_dual, parsed_as_mps
 
-def from_mpsformat(dat):
+SENSE_CODES = {'G': 0, 'E': 1, 'N': 2, 'L': 3}
+
+
+class Tableau(NamedTuple):
+    """
+    Tucker tableau representation of a linear program; still unpacks like
+    the (lb, ub, lhs, rhs, A) tuple
+
+    Attributes
+    ----------
+    lb, ub : np.ndarray
+        Lower/upper bound of each column
+    lhs, rhs : np.ndarray
+        Lower/upper bound of each row, the objective row last
+    A : Optional[scipy.sparse.csr_matrix]
+        Constraint matrix, None when it was not requested
+    """
+    lb: np.ndarray
+    ub: np.ndarray
+    lhs: np.ndarray
+    rhs: np.ndarray
+    A: Optional[csr_matrix]
+
+
+def _fixup_senses(sense, rhs, lhs, rng_lo, rng_hi):
+    """
+    Rewrite the row bounds in place according to the row sense, with RANGES
+    taking precedence over the sense/RHS pair.
+
+    Parameters
+    ----------
+    sense : np.ndarray[int8]
+        Row sense, coded with SENSE_CODES
+    rhs, lhs : np.ndarray[float64]
+        Row upper/lower bounds; on entry `rhs` holds the RHS values and `lhs`
+        may be uninitialized, every entry of it gets written
+    rng_lo, rng_hi : np.ndarray[float64]
+        RANGES lower/upper bound of each row, NaN when not specified
+
+    Returns
+    -------
+    List of (row index, RHS value) pairs for the free rows, whose RHS is an
+    objective offset rather than a bound
+    """
+    unranged = np.isnan(rng_lo)
+    ranged = ~unranged
+    g = (sense == SENSE_CODES['G']) & unranged
+    e = (sense == SENSE_CODES['E']) & unranged
+    n = (sense == SENSE_CODES['N']) & unranged
+    l = (sense == SENSE_CODES['L']) & unranged
+
+    offset = np.flatnonzero(n)
+    offset = list(zip(offset.tolist(), rhs[offset]))
+
+    lhs[g] = rhs[g]
+    rhs[g] = inf
+    lhs[e] = rhs[e]
+    lhs[n | l] = -inf
+    rhs[n] = inf
+    lhs[ranged] = rng_lo[ranged]
+    rhs[ranged] = rng_hi[ranged]
+
+    return offset
+
+
+def _assemble_matrix(dat, row_idx, col_idx):
+    """
+    Build the constraint matrix of a dict-serialized .mps file
+
+    Parameters
+    ----------
+    dat : Dict[str, Any]
+        Dictionary serialization of a .mps file
+    row_idx, col_idx : Dict[str, int]
+        Position of each row/column name in the matrix
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+    """
+    if 'COEFFICIENTS' in dat:
+        # parse_mps_arrays() output is already in coordinate form, indexed on
+        # the ROWS order; only the objective row swap needs remapping, which
+        # is read off row_idx
+        coo = dat['COEFFICIENTS']
+        perm = np.array([row_idx[r] for r in dat['ROWS']], dtype=np.int64)
+        rows_i = perm[coo['row']]
+        cols_j, data = coo['col'], coo['val']
+    else:
+        # assemble the constraint matrix straight from the (row, column)
+        # pairs in dat['COLUMNS'] in a single pass; only the nonzeros are
+        # ever touched
+        rows_i, cols_j, data = array('q'), array('q'), array('d')
+        for r, v in dat['COLUMNS'].items():
+            rows_i.extend(repeat(row_idx[r], len(v)))
+            cols_j.extend(map(col_idx.__getitem__, v))
+            data.extend(v.values())
+        rows_i = np.frombuffer(rows_i, dtype=np.int64)
+        cols_j = np.frombuffer(cols_j, dtype=np.int64)
+        data = np.frombuffer(data, dtype=np.float64)
+
+    Ac = csr_matrix((data, (rows_i, cols_j)), shape=(len(row_idx), len(col_idx)))
+    Ac.eliminate_zeros()  # fill=True stores explicit zeros
+
+    return Ac
+
+
+def from_mpsformat(dat, need_matrix=False):
     """
     Reads a dict-serialized .mps file and emits the semantics
     in a tableau representation
@@ -111,54 +224,80 @@ def from_mpsformat(dat):
     Parameters
     ----------
     dat : Dict[str, Any]
-        Dictionary serialization of a .mps file
+        Dictionary serialization of a .mps file, as returned by either
+        parse_mps or parse_mps_arrays
+    need_matrix : bool
+        Whether to assemble the constraint matrix; when False, None is
+        returned in its place
 
     Returns
     -------
-    Tucker tableau representation
+    Tableau; the constraint matrix is a scipy.sparse.csr_matrix with the
+    objective row last
     """
-    rows = array(list(dat['ROWS'].keys()))
-    columns = array(dat['ALL_COLUMNS'])
+    columns = dat['ALL_COLUMNS']
     o = True
-    row_offset = {}
+
+    # the name -> index maps are cached on `dat` (under private '_' keys) so
+    # that repeated calls on the same parsed data don't rebuild them
+    row_idx = dat.get('_row_idx')
+    if row_idx is None:
+        rows_list = list(dat['ROWS'])
+
+        # swap the objective row to the bottom
+        obj_pos = rows_list.index(sys.intern(dat['OBJ_ROW']))
+        rows_list[obj_pos], rows_list[-1] = rows_list[-1], rows_list[obj_pos]
+
+        row_idx = dat.setdefault(
+            '_row_idx', {name: i for i, name in enumerate(rows_list)})
+    rows_list = list(row_idx)
+
+    col_idx = dat.get('_col_idx')
+    if col_idx is None:
+        col_idx = dat.setdefault(
+            '_col_idx', {name: j for j, name in enumerate(columns)})
 
     lb = np.full(len(columns), 0.)
     ub = np.full(len(columns), inf)
-    lhs = np.full(len(rows), -inf)
-    rhs = np.full(len(rows), 0.)
-    Ac = np.zeros((len(rows), len(columns)))
-
-    # swap the objective row to the bottom
-    i, = np.where(rows == dat['OBJ_ROW'])
-    rows[i[0]], rows[-1] = rows[-1], rows[i[0]]
-
-    for m, row in enumerate(rows):
-        if row in dat['RANGES']:
-            lhs[m] = dat['RANGES'][row]['lower']
-            rhs[m] = dat['RANGES'][row]['upper']
-        else:
-            if row in dat['RHS']:
-                rhs[m] = dat['RHS'][row]
-            sense = dat['ROWS'][row]
-            if sense == 'G':
-                lhs[m], rhs[m] = rhs[m], -lhs[m]
-            elif sense == 'E':
-                lhs[m] = rhs[m]
-            elif sense == 'N':
-                lhs[m] = -inf
-                row_offset[rows[m]] = rhs[m]
-                rhs[m] = inf
+    lhs = np.empty(len(rows_list))
+
+    # materialize the per-row data as flat arrays; absent ranges are NaN
+    rhs_d = dat['RHS']
+    rows_d = dat['ROWS']
+    sense = np.array([SENSE_CODES[rows_d[r]] for r in rows_list], dtype=np.int8)
+    rhs = np.array([rhs_d.get(r, 0.) for r in rows_list], dtype=np.float64)
+    rng_lo = np.full(len(rows_list), np.nan)
+    rng_hi = np.full(len(rows_list), np.nan)
+    for r, rng in dat['RANGES'].items():
+        rng_lo[row_idx[r]] = rng['lower']
+        rng_hi[row_idx[r]] = rng['upper']
+
+    offset_idx = _fixup_senses(sense, rhs, lhs, rng_lo, rng_hi)
+    row_offset = {rows_list[m]: rhs_off for m, rhs_off in offset_idx}
 
     assert rhs[-1] == inf
 
-    for n, col in enumerate(columns):
-        if col in dat['BOUNDS']:
-            bnd = dat['BOUNDS'][col]
-            if 'lower' in bnd:
-                lb[n] = bnd['lower']
-            if 'upper' in bnd:
-                ub[n] = bnd['upper']
-    return (lb, ub, lhs, rhs, Ac)
+    # only the bounded columns are visited; NaN marks an unspecified side
+    bounds = dat['BOUNDS']
+    idx = np.fromiter(
+        (col_idx[c] for c in bounds),
+        dtype=np.int64,
+        count=len(bounds)
+    )
+    lo_vals = np.array([b.get('lower', np.nan) for b in bounds.values()],
+                       dtype=np.float64)
+    up_vals = np.array([b.get('upper', np.nan) for b in bounds.values()],
+                       dtype=np.float64)
+    has_lo = ~np.isnan(lo_vals)
+    has_up = ~np.isnan(up_vals)
+    lb[idx[has_lo]] = lo_vals[has_lo]
+    ub[idx[has_up]] = up_vals[has_up]
+
+    Ac = None
+    if need_matrix:
+        Ac = _assemble_matrix(dat, row_idx, col_idx)
+
+    return Tableau(lb, ub, lhs, rhs, Ac)
 
 def main(args):
 
@@ -166,7 +305,7 @@ def main(args):
         args.fill = True
 
     parsed_data = parse_mps(args.input, args.verbose, args.fill)
-    (lb, ub, lhs, rhs, Ac) = from_mpsformat(parsed_data)
+    tableau = from_mpsformat(parsed_data)
 
     # SUMMARIZE
     if args.summarize:
@@ -177,12 +316,19 @@ def main(args):
 
         if args.dual:
             dual = make_dual(parsed_data, args.sense)
-            out_dat = parsed_as_mps(dual)
+            with open(args.output, 'w', buffering=1 << 20) as fout:
+                parsed_as_mps(dual, out=fout)
         else:
-            out_dat = json.dumps(parsed_data, indent=2)
-
-        with open(args.output, 'w') as fout:
-            fout.write(out_dat)
+            # stream the JSON to file instead of building it as one big
+            # string first; leave out the private caches attached by
+            # from_mpsformat
+            with open(args.output, 'w', buffering=1 << 20) as fout:
+                json.dump(
+                    {k: v for k, v in parsed_data.items() if not k.startswith('_')},
+                    fout,
+                    indent=None if args.compact else 2,
+                    separators=(',', ':') if args.compact else None
+                )
         print(f"Data saved to {args.output}")
 
 
@@ -226,6 +372,15 @@ if __name__ == "__main__":
             "it will be set as 0 < var < +inf."
         )
     )
+    parser.add_argument(
+        "--compact",
+        action='store_true',
+        default=False,
+        help=(
+            "Write the JSON output without indentation or whitespace; much smaller "
+            "and faster to write for large models. Has no effect with --dual."
+        )
+    )
     parser.add_argument(
         "--dual",
         action='store_true',
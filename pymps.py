@@ -91,10 +91,15 @@ __license__ = "MIT License"
 __summary__ = "Python-based parser for MPS formatted linear program files"
 
 
-from collections import OrderedDict, defaultdict, Counter
+from collections import defaultdict, Counter
+from functools import lru_cache
+from itertools import repeat
+from array import array
+import io
+import logging
+import re
+import sys
 import numpy as np
-import copy
-import pandas as pd
 
 COUNTS = {
     'LO': 0,
@@ -105,13 +110,58 @@ COUNTS = {
     'PL': 0
 }
 
-ALLOWED_ROW_SENSE = ['N', 'G', 'L', 'E']
-ALLOWED_RANGES = ['G', 'L', 'E']
-ALLOWED_BOUNDS = ['LO', 'UP', 'FX', 'FR', 'MI', 'PL']
+# the ALLOWED_* constants are only used for membership tests; REQUIRED_INDICATORS
+# stays a list since it is checked in order
+ALLOWED_ROW_SENSE = frozenset(['N', 'G', 'L', 'E'])
+ALLOWED_RANGES = frozenset(['G', 'L', 'E'])
+ALLOWED_BOUNDS = frozenset(['LO', 'UP', 'FX', 'FR', 'MI', 'PL'])
 REQUIRED_INDICATORS = ['NAME', 'ROWS', 'COLUMNS']
-ALLOWED_INDICATORS = set(REQUIRED_INDICATORS) | set(
+ALLOWED_INDICATORS = frozenset(REQUIRED_INDICATORS) | frozenset(
     ['RHS', 'BOUNDS', 'RANGES'])
 
+# number of COLUMNS/RHS data records parsed together by add_cols()/add_rhs_records()
+RECORDS_BATCH_SIZE = 4096
+
+# infinite bounds, as plain floats; they compare equal to np.inf
+_POS_INF = float('inf')
+_NEG_INF = float('-inf')
+
+# messages about assumptions made while parsing, see set_verbose()
+log = logging.getLogger(__name__)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    '''
+    StreamHandler that writes to sys.stdout as it is at the time of each message, like
+    print() does; so output follows e.g. contextlib.redirect_stdout()
+    '''
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, stream):
+        # set by StreamHandler.__init__(), sys.stdout is always looked up instead
+        pass
+
+
+def set_verbose(verbose):
+    '''
+    Set the level of the module logger from the `verbose` flag of parse_mps(). When verbose
+    and logging isn't configured otherwise, messages are printed to stdout.
+
+    Params:
+    -------
+    verbose (bool) - if True, log at INFO level, otherwise only WARNING and above
+    '''
+    log.setLevel(logging.INFO if verbose else logging.WARNING)
+
+    if verbose and not log.hasHandlers():
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        log.addHandler(handler)
+
 
 def parse_mps(mps_file, verbose=False, fill=False):
     '''
@@ -120,7 +170,7 @@ def parse_mps(mps_file, verbose=False, fill=False):
     Params:
     -------
     mps_file (str) - MPS file to parse
-    verbose (bool, default False) - print messages about assumptions being made
+    verbose (bool, default False) - log messages about assumptions being made, see set_verbose()
     fill (bool, default False) - fill missing values
 
     Yields:
@@ -173,68 +223,246 @@ def parse_mps(mps_file, verbose=False, fill=False):
             "BOUNDS_id": "BND1"
     }
     '''
+    set_verbose(verbose)
+
     parsed_data = {
         'NAME': None,
-        'ROWS': OrderedDict(),
-        'COLUMNS': OrderedDict(),
-        'RHS': OrderedDict(),
+        'ROWS': {},
+        'COLUMNS': {},
+        'RHS': {},
         'BOUNDS': defaultdict(dict),
-        'RANGES': OrderedDict(),
+        'RANGES': {},
         'ALL_COLUMNS': set()
     }
 
-    current_indicator = None
+    # data record parsers, keyed on the indicator record they belong to
+    add_record = {
+        'ROWS': add_row,
+        'BOUNDS': add_bound,
+        'RANGES': add_range
+    }
+    # COLUMNS and RHS records make up the bulk of an MPS file, they are parsed
+    # in batches so their values are converted together
+    add_batch = {
+        'COLUMNS': add_cols,
+        'RHS': add_rhs_records
+    }
+    _parse_file(mps_file, parsed_data, add_record, add_batch, verbose)
 
-    # READ IN FILE
-    with open(mps_file, 'r') as fin:
-        dat = fin.readlines()
+    # ENSURE ALL REQUIRED RECORDS EXIST
+    for l in REQUIRED_INDICATORS:
+        if not len(parsed_data[l]):
+            raise ValueError(f"Indicator record '{l}' is missing!")
 
-    # ITERATE OVER EACH LINE, PARSING IT
-    for l in dat:
-        current_indicator, data = parse_line(
-            l,
-            current_indicator,
-        )
+    # CONFORM DATA
+    parsed_data = conform_bounds(parsed_data, verbose, fill)
+    parsed_data = conform_rhs(parsed_data, verbose, fill)
+    parsed_data = conform_cols(parsed_data, fill)
+    conform_objective(parsed_data)
+
+    return parsed_data
+
+
+def parse_mps_arrays(mps_file, verbose=False, fill=False):
+    '''
+    Parse a fixed-format MPS file like parse_mps(), except that the COLUMNS
+    coefficients are streamed into coordinate (COO) arrays instead of being
+    stored as a dict per row. This avoids building one Python dict entry per
+    nonzero, and the arrays can be handed as-is to a sparse matrix
+    constructor.
+
+    NOTE: `fill` only applies to the RHS and BOUNDS; missing coefficients
+    are implicitly 0 in the coordinate representation.
+
+    Params:
+    -------
+    mps_file (str) - MPS file to parse
+    verbose (bool, default False) - log messages about assumptions being made, see set_verbose()
+    fill (bool, default False) - fill missing RHS & BOUNDS values
+
+    Yields:
+    -------
+    Same structure as parse_mps() with the "COLUMNS" section replaced by:
+    {
+        "COEFFICIENTS": {
+            "row": np.ndarray (int32) - index into list(parsed["ROWS"]),
+            "col": np.ndarray (int32) - index into parsed["ALL_COLUMNS"],
+            "val": np.ndarray (float64) - coefficient
+        },
+        ...
+    }
+    where ALL_COLUMNS lists the columns in order of appearance.
+    '''
+    set_verbose(verbose)
+
+    parsed_data = {
+        'NAME': None,
+        'ROWS': {},
+        'RHS': {},
+        'BOUNDS': defaultdict(dict),
+        'RANGES': {},
+        'ALL_COLUMNS': []
+    }
 
-        # IF ON A DATA INDICATOR
-        if data:
-            if current_indicator == 'NAME':
-                assert not parsed_data['NAME'], f"NAME already specified as {parsed_data['NAME']}"
-
-                parsed_data['NAME'] = data
-            elif current_indicator == 'ROWS':
-                parsed_data = add_row(
-                    data,
-                    parsed_data,
-                    verbose
-                )
-            elif current_indicator == 'COLUMNS':
-                parsed_data = add_col(data, parsed_data)
-            elif current_indicator == 'RHS':
-                parsed_data = add_rhs(data, parsed_data, verbose)
-            elif current_indicator == 'BOUNDS':
-                parsed_data = add_bound(
-                    data,
-                    parsed_data,
-                    verbose
-                )
-            elif current_indicator == 'RANGES':
-                parsed_data = add_range(data, parsed_data, verbose)
+    rows_i, cols_j, vals = array('i'), array('i'), array('d')
+    row_index, col_index = {}, {}
+
+    def add_coefficients(records, parsed_data, verbose):
+        # ROWS always precedes COLUMNS, so the row order is final here
+        if not row_index:
+            row_index.update((r, i) for i, r in enumerate(parsed_data['ROWS']))
+
+        row_vals = []
+        add_i, add_j, add_val = rows_i.append, cols_j.append, row_vals.append
+        try:
+            for data in records:
+                # a record is [col_id, row_id, row_val] optionally followed by
+                # [row_id, row_val], see add_cols()
+                if len(data) != 5 and len(data) != 3:
+                    # malformed record, raises the appropriate error
+                    parse_wrap_cols(data, 'COLUMNS')
+
+                col_id = data[0]
+                j = col_index.get(col_id)
+                if j is None:
+                    col_id = sys.intern(col_id)
+                    j = col_index[col_id] = len(col_index)
+                    parsed_data['ALL_COLUMNS'].append(col_id)
+
+                for k in range(1, len(data), 2):
+                    row_id = data[k]
+
+                    i = row_index.get(row_id)
+                    assert i is not None, (
+                        f"COLUMNS makes reference to non-existant ROW(s) {set([row_id])}!"
+                    )
+
+                    add_i(i)
+                    add_j(j)
+                    add_val(data[k + 1])
+        except AssertionError:
+            # a bad value before the offending record is reported first, so that errors
+            # are raised in record order
+            for _ in _numerics(row_vals, 'ROW'):
+                pass
+            raise
+
+        # the values of the whole batch are converted together, see add_cols()
+        try:
+            row_vals = list(map(float, row_vals))
+        except ValueError:
+            row_vals = list(_numerics(row_vals, 'ROW'))
+        vals.extend(row_vals)
+
+    add_record = {
+        'ROWS': add_row,
+        'BOUNDS': add_bound,
+        'RANGES': add_range
+    }
+    add_batch = {
+        'COLUMNS': add_coefficients,
+        'RHS': add_rhs_records
+    }
+    _parse_file(mps_file, parsed_data, add_record, add_batch, verbose)
+
+    coo = {
+        'row': np.frombuffer(rows_i, dtype=np.int32),
+        'col': np.frombuffer(cols_j, dtype=np.int32),
+        'val': np.frombuffer(vals, dtype=np.float64)
+    }
+    parsed_data['COEFFICIENTS'] = coo
 
     # ENSURE ALL REQUIRED RECORDS EXIST
     for l in REQUIRED_INDICATORS:
-        if not len(parsed_data[l]):
+        section = coo['val'] if l == 'COLUMNS' else parsed_data[l]
+        if not len(section):
             raise ValueError(f"Indicator record '{l}' is missing!")
 
+    # each (row, col) pair may only be specified once; report the first repeat in file
+    # order, as add_cols() does
+    key = coo['row'].astype(np.int64) * len(col_index) + coo['col']
+    order = np.argsort(key, kind='stable')
+    repeats = order[1:][key[order[1:]] == key[order[:-1]]]
+    if len(repeats):
+        k = repeats.min()
+        col_id = parsed_data['ALL_COLUMNS'][coo['col'][k]]
+        row_id = list(parsed_data['ROWS'])[coo['row'][k]]
+        raise AssertionError(f"COLUMN {col_id} specified twice in ROW {row_id}!")
+
     # CONFORM DATA
     parsed_data = conform_bounds(parsed_data, verbose, fill)
     parsed_data = conform_rhs(parsed_data, verbose, fill)
-    parsed_data = conform_cols(parsed_data, fill)
     conform_objective(parsed_data)
 
     return parsed_data
 
 
+def _parse_file(mps_file, parsed_data, add_record, add_batch, verbose):
+    '''
+    Stream an MPS file, handing each data record to the parser of the indicator record it
+    belongs to; shared by parse_mps() and parse_mps_arrays().
+
+    Params:
+    -------
+    mps_file (str) - MPS file to parse
+    parsed_data (dict) - current state of all parsed data
+    add_record (dict) - {indicator: parser of a single data record}
+    add_batch (dict) - {indicator: parser of a list of data records}; these records are
+        buffered and parsed RECORDS_BATCH_SIZE at a time
+    verbose (bool) - passed on to the parsers
+
+    Updates:
+    --------
+    parsed_data, by way of the parsers; parsed_data['NAME'] is set from the NAME record
+    '''
+    records = []
+
+    def buffered(add_records):
+        def add_buffered(data, parsed_data, verbose):
+            records.append(data)
+            if len(records) == RECORDS_BATCH_SIZE:
+                add_records(records, parsed_data, verbose)
+                records.clear()
+
+        return add_buffered
+
+    handlers = dict(add_record)
+    handlers.update((indicator, buffered(add_records))
+                    for indicator, add_records in add_batch.items())
+
+    current_indicator = None
+    _parse_line = parse_line
+    handler = None
+
+    # STREAM THE FILE, PARSING EACH LINE AS IT IS READ
+    with open(mps_file, 'r', buffering=1 << 20) as fin:
+        for l in fin:
+            # anything but a data record ends a run of buffered records; parse
+            # them first so that errors are still raised in file order
+            if records and l[0] != ' ':
+                add_batch[current_indicator](records, parsed_data, verbose)
+                records.clear()
+
+            indicator, data = _parse_line(l, current_indicator)
+            if indicator is not current_indicator:
+                current_indicator = indicator
+                handler = handlers.get(indicator)
+
+            # IF ON A DATA INDICATOR
+            if data:
+                if handler is not None:
+                    handler(data, parsed_data, verbose)
+                elif current_indicator == 'NAME':
+                    assert not parsed_data['NAME'], (
+                        f"NAME already specified as {parsed_data['NAME']}"
+                    )
+
+                    parsed_data['NAME'] = data
+
+    if records:
+        add_batch[current_indicator](records, parsed_data, verbose)
+
+
 def make_dual(dat, sense='MAX'):
     '''
     Covert a parsed MPS into its dual formulation
@@ -294,8 +522,7 @@ def make_dual(dat, sense='MAX'):
     for l in dat['COLUMNS'].values():
         assert len(l) == num_cols, "Ensure you've used fill=True"
 
-    dat_cp = copy.deepcopy(dat)
-    dat_cp['ALL_COLUMNS'] = set(dat_cp['ALL_COLUMNS'])
+    dat_cp = _clone(dat)
     obj = dat_cp['OBJ_ROW']
 
     dual = {}
@@ -312,62 +539,92 @@ def make_dual(dat, sense='MAX'):
     if not obj in dat_cp['RHS']:
         dat_cp['RHS'][obj] = 0
 
-    # convert all 'L' row constraints into 'G' and multiply row by -1
+    columns = dat_cp['COLUMNS']
+
+    # convert all 'L' row constraints into 'G' and multiply row by -1; the
+    # rows already are copies, so they're negated in place. Zeros are left as
+    # they are, so that the dual doesn't get -0.0 coefficients
     for rl, sense in dat_cp['ROWS'].items():
         if sense == 'L':
             dat_cp['ROWS'][rl] = 'G'
-            dat_cp['COLUMNS'][rl] = {k: (-1*v)
-                                     for k, v in dat_cp['COLUMNS'][rl].items()}
-            dat_cp['RHS'][rl] = -1 * dat_cp['RHS'][rl]
-
-    for cl, v in dat_cp['BOUNDS'].items():
+            row = columns[rl]
+            for k, v in row.items():
+                row[k] = -v if v else v
+            rhs = dat_cp['RHS'][rl]
+            dat_cp['RHS'][rl] = -rhs if rhs else rhs
+
+    # classify every bound up front with vectorized masks; a missing bound
+    # is NaN, which fails every comparison below just like None did
+    bounds = dat_cp['BOUNDS']
+    lbs = np.array([v.get('lower', np.nan) for v in bounds.values()],
+                   dtype=np.float64)
+    ubs = np.array([v.get('upper', np.nan) for v in bounds.values()],
+                   dtype=np.float64)
+    lb_free, ub_free = np.isneginf(lbs), np.isposinf(ubs)
+    kinds = np.select(
+        [
+            (lbs == 0) & (np.isnan(ubs) | ub_free),                # x >= 0
+            (np.isnan(lbs) | lb_free) & (ubs == 0),                # x <= 0
+            lb_free & ub_free,                                     # x is free
+            lbs == ubs,                                            # a <= x <= a
+            (lbs != 0) & np.isfinite(lbs) & ub_free,               # a <= x <= +INF
+            (ubs != 0) & np.isfinite(ubs) & lb_free,               # -INF <= x <= a
+            np.isfinite(lbs) & np.isfinite(ubs)                    # a <= x <= b
+        ],
+        ['GE0', 'LE0', 'FR', 'FX', 'LO', 'UP', 'DB'],
+        default=''
+    ).tolist()
+
+    for (cl, v), kind in zip(bounds.items(), kinds):
         ub, lb = v.get('upper', None), v.get('lower', None)
 
         # x >= 0
-        if lb == 0 and (ub == None or ub == np.Inf):
+        if kind == 'GE0':
             dual['ROWS'][cl] = 'L'
         # x <= 0
-        elif (lb == None or lb == np.NINF) and ub == 0:
+        elif kind == 'LE0':
             dual['ROWS'][cl] = 'L'
-            for rl in dat['ROWS'].keys():
-                dat_cp['COLUMNS'][rl][cl] = -1 * dat_cp['COLUMNS'][rl][cl]
+            for rl in dat['ROWS']:
+                row = columns[rl]
+                coef = row[cl]
+                row[cl] = -coef if coef else coef
         # x is free
-        elif lb == np.NINF and ub == np.Inf:
+        elif kind == 'FR':
             dual['ROWS'][cl] = 'E'
-        else:
-            # non standard constraints (e.g. x <= 4) are shifted
-            # NOTE: this will create an objective row "offset"
 
-            # a <= x <= a -> x = a
-            if ub == lb:
-                dat_cp = shift_var(dat_cp, cl, lb, 'FX')
-            else:
-                # a <= x <= +INF (LO)
-                if lb and np.isfinite(lb) and ub == np.Inf:
-                    dual['ROWS'][cl] = 'L'
-                    dat_cp = shift_var(dat_cp, cl, lb, 'LO')
-                # -INF <= x <= a (UP)
-                elif ub and np.isfinite(ub) and lb == np.NINF:
-                    # this converts variable into a lower bound, so we set
-                    # it's dual row into an 'L'
-                    dual['ROWS'][cl] = 'L'
-                    dat_cp = shift_var(dat_cp, cl, ub, 'UP')
-                # a <= x <= b (LO & UP)
-                elif np.isfinite(ub) and np.isfinite(lb):
-                    label = cl + '_db'
-
-                    # add new row constraint for the LO bound
-                    dat_cp['RHS'][label] = lb
-                    dat_cp['ROWS'][label] = 'G'
-                    dat_cp['COLUMNS'][label] = {
-                        c: (0 if c != cl else 1) for c in dat_cp['ALL_COLUMNS']}
-
-                    # shift
-                    dual['ROWS'][cl] = 'L'
-
-                    dat_cp = shift_var(dat_cp, cl, ub, 'UP')
-                else:
-                    raise ValueError('issue')
+        # non standard constraints (e.g. x <= 4) are shifted
+        # NOTE: this will create an objective row "offset"
+
+        # a <= x <= a -> x = a
+        elif kind == 'FX':
+            dat_cp = shift_var(dat_cp, cl, lb, 'FX')
+        # a <= x <= +INF (LO)
+        elif kind == 'LO':
+            dual['ROWS'][cl] = 'L'
+            dat_cp = shift_var(dat_cp, cl, lb, 'LO')
+        # -INF <= x <= a (UP)
+        elif kind == 'UP':
+            # this converts variable into a lower bound, so we set
+            # it's dual row into an 'L'
+            dual['ROWS'][cl] = 'L'
+            dat_cp = shift_var(dat_cp, cl, ub, 'UP')
+        # a <= x <= b (LO & UP)
+        elif kind == 'DB':
+            label = cl + '_db'
+
+            # add new row constraint for the LO bound
+            dat_cp['RHS'][label] = lb
+            dat_cp['ROWS'][label] = 'G'
+            dat_cp['COLUMNS'][label] = dict.fromkeys(
+                dat_cp['ALL_COLUMNS'], 0)
+            dat_cp['COLUMNS'][label][cl] = 1
+
+            # shift
+            dual['ROWS'][cl] = 'L'
+
+            dat_cp = shift_var(dat_cp, cl, ub, 'UP')
+        else:
+            raise ValueError('issue')
 
     # dual RHS
     dual['RHS'] = dat_cp['COLUMNS'][obj]
@@ -377,10 +634,9 @@ def make_dual(dat, sense='MAX'):
     if offset:
         dual['RHS'][obj_lb] = offset
 
-    # transpose A
-    A = pd.DataFrame.from_dict(dat_cp['COLUMNS'], orient='index')
-    A.drop([obj], inplace=True)  # remove obj row
-    dual['COLUMNS'] = A.transpose().to_dict(orient='index')
+    # transpose A, without the obj row
+    dual['COLUMNS'] = _transpose(
+        (rl, v) for rl, v in dat_cp['COLUMNS'].items() if rl != obj)
 
     # dual objective
     dual['COLUMNS'][obj_lb] = dat_cp['RHS']
@@ -394,11 +650,37 @@ def make_dual(dat, sense='MAX'):
         elif sense == 'G':
             dual['BOUNDS'][rl] = {'lower': 0}
         elif sense == 'E':
-            dual['BOUNDS'][rl] = {'lower': np.NINF, 'upper': np.Inf}
+            dual['BOUNDS'][rl] = {'lower': _NEG_INF, 'upper': _POS_INF}
 
     return dual
 
 
+def _clone(dat):
+    '''
+    Copy the sections of a parsed MPS that make_dual() modifies; this is a
+    deep copy for the parse_mps() structure, which only nests dicts of
+    strings and floats, without the overhead of copy.deepcopy().
+
+    Params:
+    -------
+    dat (dict) - output from parse_mps
+
+    Return:
+    -------
+    copy of dat with its NAME, OBJ_ROW, ROWS, RHS, BOUNDS, COLUMNS and
+    ALL_COLUMNS (as a set)
+    '''
+    return {
+        'NAME': dat['NAME'],
+        'OBJ_ROW': dat['OBJ_ROW'],
+        'ROWS': dict(dat['ROWS']),
+        'RHS': dict(dat['RHS']),
+        'BOUNDS': {k: dict(v) for k, v in dat['BOUNDS'].items()},
+        'COLUMNS': {k: dict(v) for k, v in dat['COLUMNS'].items()},
+        'ALL_COLUMNS': set(dat['ALL_COLUMNS'])
+    }
+
+
 def shift_var(dat, var, val, bound):
     '''
     Shift a variable `var` by a value `val`; this has the effect of changing
@@ -424,21 +706,31 @@ def shift_var(dat, var, val, bound):
     -------
     updated dat with updated dat['RHS']
     '''
-    for i, rl in enumerate(dat['ROWS'].keys()):
-        coef = dat['COLUMNS'][rl][var]
-        dat['RHS'][rl] = dat['RHS'][rl] - coef * val
-
-        if bound == 'UP':
-            dat['COLUMNS'][rl][var] = -1*coef
-        elif bound == 'FX':
-            del dat['COLUMNS'][rl][var]
-            if var in dat['ALL_COLUMNS']:
-                dat['ALL_COLUMNS'].remove(var)
+    columns, rhs = dat['COLUMNS'], dat['RHS']
+
+    # `bound` is fixed for the whole call, so there is one loop per type
+    if bound == 'UP':
+        for rl in dat['ROWS']:
+            row = columns[rl]
+            coef = row[var]
+            rhs[rl] -= coef * val
+            # zeros are left as they are, rather than becoming -0.0
+            row[var] = -coef if coef else coef
+    elif bound == 'FX':
+        for rl in dat['ROWS']:
+            rhs[rl] -= columns[rl].pop(var) * val
+
+        # ALL_COLUMNS is a list in parse_mps() output and a set in make_dual()'s copy
+        if var in dat['ALL_COLUMNS']:
+            dat['ALL_COLUMNS'].remove(var)
+    else:
+        for rl in dat['ROWS']:
+            rhs[rl] -= columns[rl][var] * val
 
     return dat
 
 
-def parsed_as_mps(dat):
+def parsed_as_mps(dat, out=None):
     '''
     Take a parsed MPS and reformat it as a single string formatted as
     valid MPS; that is, it can be written to file and used as a fixed
@@ -447,19 +739,30 @@ def parsed_as_mps(dat):
     Params:
     -------
     dat (dict) - output of make_dual() or parse_mps()
+    out (file-like, default None) - text stream to write the MPS to, e.g. an
+        open file; when None the MPS is returned as a string
+
+    Return:
+    -------
+    the MPS as a str when `out` is None, otherwise None
     '''
 
-    mps_str = f"NAME          {dat['NAME']}\n"
+    buf = io.StringIO() if out is None else out
+    write = buf.write
+
+    # fields start at columns 5, 15, 25 and 40; a longer field pushes the
+    # following ones right rather than being truncated
+    write(f"NAME          {dat['NAME']}\n")
 
     if 'OBJSENSE' in dat:
-        mps_str += "OBJSENSE\n"
-        mps_str += f"  {dat['OBJSENSE']}\n"
-        mps_str += "OBJNAME\n"
-        mps_str += f"  {dat['OBJNAME']}\n"
+        write("OBJSENSE\n")
+        write(f"  {dat['OBJSENSE']}\n")
+        write("OBJNAME\n")
+        write(f"  {dat['OBJNAME']}\n")
 
-    mps_str += "ROWS\n"
+    write("ROWS\n")
     for rl, sense in dat['ROWS'].items():
-        mps_str += f" {sense}  {rl}\n"
+        write(f" {sense}  {rl}\n")
 
     '''
     Apparently MPS wants all of the same COLUMNS specified one line after
@@ -470,30 +773,24 @@ def parsed_as_mps(dat):
         C01    R02   6
     We have to group all of the same column labels together.
     '''
-    A = pd.DataFrame.from_dict(dat['COLUMNS'], orient='index')
-    mps_str += "COLUMNS\n"
-    for cl, v in A.to_dict().items():
+    write("COLUMNS\n")
+    for cl, v in _transpose(dat['COLUMNS'].items()).items():
         for rl, coef in v.items():
-            sp1 = " " * 4
-            sp2 = " " * (14 - len(sp1) - len(cl))
-            sp3 = " " * (24 - len(sp1) - len(cl) - len(sp2) - len(rl))
-            mps_str += f"{sp1}{cl}{sp2}{rl}{sp3}{str(coef)}\n"
+            field = f"    {cl:<10}{rl}"
+            write(f"{field:<24}{coef}\n")
 
-    mps_str += "RHS\n"
+    write("RHS\n")
     for rl, v in dat['RHS'].items():
-        sp1 = " " * 4
-        label = 'RHS'
-        sp2 = " " * (14 - len(sp1) - len(label))
-        sp3 = " " * (24 - len(sp1) - len(label) - len(sp2) - len(rl))
-        mps_str += f"{sp1}{label}{sp2}{rl}{sp3}{str(v)}\n"
+        field = f"    {'RHS':<10}{rl}"
+        write(f"{field:<24}{v}\n")
 
-    mps_str += "BOUNDS\n"
+    write("BOUNDS\n")
     for rl, v in dat['BOUNDS'].items():
         lb, ub = v.get('lower', None), v.get('upper', None)
         bound_val = None
         vector = 'BOUND'
 
-        if lb == np.NINF and ub == np.Inf:
+        if lb == _NEG_INF and ub == _POS_INF:
             label = 'FR'
         elif lb == ub and not lb is None:
             label = 'FX'
@@ -505,20 +802,105 @@ def parsed_as_mps(dat):
             label = 'UP'
             bound_val = ub
 
-        sp1 = " " * 4
-        sp2 = " " * (14 - len(sp1) - len(label))
-        sp3 = " " * (24 - len(sp1) - len(label) - len(sp2) - len(vector))
+        field = f"    {label:<10}{vector}"
+        field = f"{field:<24}{rl}"
 
         if label != 'FR':
-            sp4 = " " * (39 - len(sp1) - len(label) -
-                         len(sp2) - len(vector) - len(sp3) - len(rl))
-            mps_str += f"{sp1}{label}{sp2}{vector}{sp3}{rl}{sp4}{str(bound_val)}\n"
+            write(f"{field:<39}{bound_val}\n")
         else:
-            mps_str += f"{sp1}{label}{sp2}{vector}{sp3}{rl}\n"
+            write(f"{field}\n")
+
+    write("ENDATA\n")
 
-    mps_str += "ENDATA\n"
+    if out is None:
+        return buf.getvalue()
 
-    return mps_str
+
+def columns_as_csc(dat, dtype=np.float64):
+    '''
+    Convert the COLUMNS coefficients of a parsed MPS into compressed sparse
+    column (CSC) arrays; the coefficients of column j are
+    values[col_ptr[j]:col_ptr[j+1]], in the rows
+    row_indices[col_ptr[j]:col_ptr[j+1]].
+
+    Params:
+    -------
+    dat (dict) - output of parse_mps(), make_dual() or parse_mps_arrays()
+    dtype (numpy dtype, default np.float64) - dtype of the coefficients; e.g.
+        np.float32 halves their memory for solvers that accept it
+
+    Return:
+    -------
+    {
+        "values": np.ndarray (dtype) - coefficient, nnz long
+        "row_indices": np.ndarray (int32) - index into row_labels, nnz long
+        "col_ptr": np.ndarray (int32) - len(col_labels) + 1 long
+        "row_labels": list of row labels, in dat['ROWS'] order
+        "col_labels": list of column labels, in dat['ALL_COLUMNS'] order; make_dual() output
+            has no ALL_COLUMNS, its columns are listed in order of appearance in COLUMNS
+    }
+    '''
+    row_labels = list(dat['ROWS'])
+    if 'ALL_COLUMNS' in dat:
+        col_labels = list(dat['ALL_COLUMNS'])
+    else:
+        col_labels = list(dict.fromkeys(
+            cl for cols in dat['COLUMNS'].values() for cl in cols))
+
+    if 'COEFFICIENTS' in dat:
+        coo = dat['COEFFICIENTS']
+        rows_i, cols_j, vals = coo['row'], coo['col'], coo['val']
+    else:
+        row_index = {r: i for i, r in enumerate(row_labels)}
+        col_index = {c: j for j, c in enumerate(col_labels)}
+
+        rows_i, cols_j, vals = array('i'), array('i'), array('d')
+        for rl, cols in dat['COLUMNS'].items():
+            rows_i.extend(repeat(row_index[rl], len(cols)))
+            cols_j.extend(map(col_index.__getitem__, cols))
+            vals.extend(cols.values())
+
+        rows_i = np.frombuffer(rows_i, dtype=np.int32)
+        cols_j = np.frombuffer(cols_j, dtype=np.int32)
+        vals = np.frombuffer(vals, dtype=np.float64)
+
+    # a stable sort keeps the rows of each column in their original order
+    order = np.argsort(cols_j, kind='stable')
+    col_ptr = np.zeros(len(col_labels) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(cols_j, minlength=len(col_labels)), out=col_ptr[1:])
+
+    return {
+        'values': np.asarray(vals, dtype=dtype)[order],
+        'row_indices': rows_i[order],
+        'col_ptr': col_ptr,
+        'row_labels': row_labels,
+        'col_labels': col_labels
+    }
+
+
+def _transpose(rows):
+    '''
+    Transpose a nested {row label: {column label: coefficient}} mapping into
+    {column label: {row label: coefficient}}, visiting only the stored
+    coefficients; columns are ordered on first appearance.
+
+    Params:
+    -------
+    rows (iterable) - (row label, {column label: coefficient}) pairs
+
+    Return:
+    -------
+    dict of dicts with float coefficients
+    '''
+    cols = {}
+    for rl, v in rows:
+        for cl, coef in v.items():
+            col = cols.get(cl)
+            if col is None:
+                col = cols[cl] = {}
+            col[rl] = float(coef)
+
+    return cols
 
 
 def make_numeric(n):
@@ -538,6 +920,13 @@ def make_numeric(n):
     float representation of input
     '''
 
+    # the vast majority of values are already valid python floats; only
+    # pay for the rewrites below when they're not
+    try:
+        return float(n)
+    except ValueError:
+        pass
+
     n = n.lower()
 
     # handle FORTRAN formats with 'D'
@@ -551,13 +940,70 @@ def make_numeric(n):
     return float(n)
 
 
+# bound values are dominated by a few constants (0, 1, ...) repeated across columns,
+# so add_bound() converts them through a small cache
+_bound_numeric = lru_cache(maxsize=256)(make_numeric)
+
+# first characters a make_numeric() input can start with: a sign, a digit, a '.'
+# or the start of inf/infinity/nan
+_NUMERIC_START = re.compile(r'[+-]?[0-9.iInN]')
+
+
+def _is_numeric(token):
+    '''
+    Whether make_numeric() accepts `token`. Tokens that can't start a number,
+    e.g. most row/column labels, are rejected without raising and catching a
+    ValueError.
+
+    Params:
+    -------
+    token (str) - field of a data record
+
+    Return:
+    -------
+    bool
+    '''
+    if not _NUMERIC_START.match(token):
+        return False
+
+    try:
+        _bound_numeric(token)
+    except ValueError:
+        return False
+
+    return True
+
+
+def _numerics(values, section):
+    '''
+    Convert data record values with make_numeric(), one at a time; used once converting a
+    whole batch with float() has failed. Values are converted lazily, so that callers can
+    interleave the conversion with their own checks and raise errors in record order.
+
+    Params:
+    -------
+    values (iterable) - str values of the data records
+    section (str) - section name used in the error message, e.g. 'ROW' or 'RHS'
+
+    Yield:
+    ------
+    float
+    '''
+    for val in values:
+        try:
+            num = make_numeric(val)
+        except ValueError:
+            raise ValueError(f"{section} value must be a float, found: {val}")
+        yield num
+
+
 def summarize(data):
     '''
     Print out a summary of the parsed MPS.
     '''
 
     # count of each row constraint type
-    group_rows = Counter(list(data['ROWS'].values()))
+    group_rows = Counter(data['ROWS'].values())
 
     print(f"Number of columns: {len(data['COLUMNS'])}")
     print(f"Number of rows: {len(data['ROWS'])}")
@@ -607,18 +1053,16 @@ def conform_cols(parsed_data, fill):
         bad_rows), f"COLUMNS makes reference to non-existant ROW(s) {bad_rows}!"
 
     # fill missing coeff with 0 if needed
+    # NOTE: the set difference/dict.fromkeys/update all run in C; a pandas
+    # reindex round trip was measured to be slower than the plain loop
     if fill:
+        all_cols = parsed_data['ALL_COLUMNS']
         for r in all_rows:
-
-            if not parsed_data['COLUMNS'].get(r, None):
-                parsed_data['COLUMNS'][r] = {}
-
-            for c in parsed_data['ALL_COLUMNS']:
-                if not parsed_data['COLUMNS'][r].get(c, None):
-                    parsed_data['COLUMNS'][r][c] = 0
+            row = parsed_data['COLUMNS'].setdefault(r, {})
+            row.update(dict.fromkeys(all_cols.difference(row), 0))
 
     # in order to output to JSON
-    parsed_data['ALL_COLUMNS'] = sorted(list(parsed_data['ALL_COLUMNS']))
+    parsed_data['ALL_COLUMNS'] = sorted(parsed_data['ALL_COLUMNS'])
 
     return parsed_data
 
@@ -631,7 +1075,7 @@ def conform_rhs(parsed_data, verbose, fill):
     Params:
     -------
     parsed_data (dict) - current state of all parsed data, must have 'BOUNDS' & 'COLUMNS' keys
-    verbose (bool) - if True, print out statement about unspecified bound.
+    verbose (bool) - if True, log a statement about unspecified bound.
     fill (bool) - if True, fill unspecified bound with RHS = 0
 
     Yield:
@@ -644,10 +1088,9 @@ def conform_rhs(parsed_data, verbose, fill):
             if not row_id in parsed_data['RHS']:
                 if verbose:
                     if fill:
-                        print(
-                            f"ROW {row_id} has no RHS value; setting it to 0.")
+                        log.info("ROW %s has no RHS value; setting it to 0.", row_id)
                     else:
-                        print(f"ROW {row_id} has no RHS value.")
+                        log.info("ROW %s has no RHS value.", row_id)
 
                 if fill:
                     parsed_data['RHS'][row_id] = 0
@@ -680,7 +1123,7 @@ def conform_bounds(parsed_data, verbose, fill):
     Params:
     -------
     parsed_data (dict) - current state of all parsed data, must have 'BOUNDS' & 'COLUMNS' keys
-    verbose (bool) - if True, print out statement about unspecified bound.
+    verbose (bool) - if True, log a statement about unspecified bound.
     fill (bool) - if True, fill unspecified bound with 0 < var < +inf
 
     Yield:
@@ -699,14 +1142,13 @@ def conform_bounds(parsed_data, verbose, fill):
 
             if verbose:
                 if fill:
-                    print(
-                        f"BOUND unspecified for '{c}'; setting it to 0 <= {c} <= +inf")
+                    log.info("BOUND unspecified for '%s'; setting it to 0 <= %s <= +inf", c, c)
                 else:
-                    print(f"BOUND unspecified for '{c}'")
+                    log.info("BOUND unspecified for '%s'", c)
 
             if fill:
                 parsed_data['BOUNDS'][c] = {
-                    'upper': np.Inf,
+                    'upper': _POS_INF,
                     'lower': 0
                 }
         else:
@@ -721,19 +1163,16 @@ def conform_bounds(parsed_data, verbose, fill):
                     if ub > 0:
                         parsed_data['BOUNDS'][c]['lower'] = 0
                         if verbose:
-                            print(
-                                f"Lower bound unspecified for {c}, setting it to 0")
+                            log.info("Lower bound unspecified for %s, setting it to 0", c)
                     elif ub <= 0:
-                        parsed_data['BOUNDS'][c]['lower'] = np.NINF
+                        parsed_data['BOUNDS'][c]['lower'] = _NEG_INF
                         if verbose:
-                            print(
-                                f"Lower bound unspecified for {c}, setting it to -Inf")
+                            log.info("Lower bound unspecified for %s, setting it to -Inf", c)
                 # missing upper bound
                 elif ub == None and lb != None:
-                    parsed_data['BOUNDS'][c]['upper'] = np.Inf
+                    parsed_data['BOUNDS'][c]['upper'] = _POS_INF
                     if verbose:
-                        print(
-                            f"Upper bound unspecified for {c}, setting it to +Inf.")
+                        log.info("Upper bound unspecified for %s, setting it to +Inf.", c)
                 elif ub == None and lb == None:
                     # should never happend
                     raise ValueError(
@@ -836,13 +1275,11 @@ def add_range(data, parsed_data, verbose):
     assert len(parsed_data['RHS']), 'You must provided RHS before RANGES.'
     assert len(parsed_data['ROWS']), 'You must provided ROWS before RANGES.'
 
-    if not 'RANGES_id' in parsed_data or range_id == parsed_data.get('RANGES_id', None):
-        parsed_data['RANGES_id'] = range_id
-    else:
+    # the first RANGES vector seen is the one kept
+    if parsed_data.setdefault('RANGES_id', range_id) != range_id:
         if verbose:
-            print(
-                f'More than one RANGE vector specified, skipping {range_id}.')
-        return parsed_data
+            log.info('More than one RANGE vector specified, skipping %s.', range_id)
+        return
 
     for row_id, r in range_data:
 
@@ -873,13 +1310,11 @@ def add_range(data, parsed_data, verbose):
 
         assert h < u, f'RANGES invalid, {h} must be less than {u}.'
 
-        parsed_data['RANGES'][row_id] = {
+        parsed_data['RANGES'][sys.intern(row_id)] = {
             'upper': u,
             'lower': h
         }
 
-    return parsed_data
-
 
 def add_bound(data, parsed_data, verbose):
     '''
@@ -903,11 +1338,11 @@ def add_bound(data, parsed_data, verbose):
       len 4: [bound_type, bound_id, col_id, bound_val]
       len 3: [bound_type, col_id, bound_val] OR [bound_type, bound_id, col_id]
     parsed_data (dict) - current state of all parsed data, must have 'BOUNDS' key
-    verbose (bool) - if True, print out statement about ignored bound vector.
+    verbose (bool) - if True, log a statement about ignored bound vector.
 
-    Yield:
-    ------
-    updated parsed_data['BOUNDS'] section in form of OrderedDict():
+    Updates:
+    --------
+    parsed_data['BOUNDS'] section in form of dict:
       "BOUNDS": {
         "B0100210": {
           "upper": 1550.0,
@@ -932,82 +1367,104 @@ def add_bound(data, parsed_data, verbose):
         if data[0] == 'FR':
             bound_type, bound_id, col_id, bound_val = data[0], data[1], data[
                 2], None
+        elif not _is_numeric(data[-1]):
+            # bound_value was omitted, set it to 0 if bound type UP, LO, or FX
+            bound_val = None
+            if data[0] in ['UP', 'LO', 'FX']:
+                bound_val = 0
+            bound_type, bound_id, col_id, bound_val = data[0], data[1], data[2], bound_val
+
+        # bound_id was (maybe) omitted
+
+        # ensure we don't have a case like [FR 12 14] where it's ambiguous which
+        # is the bound_id and which is the bound_val
+        elif _is_numeric(data[1]):
+            raise ValueError(f"The BOUND {data} is ambiguous.")
         else:
-            try:
-                make_numeric(data[-1])
-            except:
-                # bound_value was omitted, set it to 0 if bound type UP, LO, or FX
-                bound_val = None
-                if data[0] in ['UP', 'LO', 'FX']:
-                    bound_val = 0
-                bound_type, bound_id, col_id, bound_val = data[0], data[1], data[2], bound_val
-            else:
-                # bound_id was (maybe) omitted
-
-                # ensure we don't have a case like [FR 12 14] where it's ambiguous which
-                # is the bound_id and which is the bound_val
-                # if we are in an unambiguous case, this try should fail
-                try:
-                    make_numeric(data[1])
-                except:
-                    bound_type, bound_id, col_id, bound_val = data[0], '', data[1], data[2]
-                else:
-                    raise ValueError(f"The BOUND {data} is ambiguous.")
+            bound_type, bound_id, col_id, bound_val = data[0], '', data[1], data[2]
 
     else:
         bound_type, bound_id, col_id, bound_val = data
 
     if bound_val:
-        bound_val = make_numeric(bound_val)
+        bound_val = _bound_numeric(bound_val)
+
+    col_id = sys.intern(col_id)
 
-    assert bound_type in ALLOWED_BOUNDS, f"Supplied BOUND type is not accepted, found: {ALLOWED_BOUNDS}"
+    assert bound_type in ALLOWED_BOUNDS, (
+        f"Supplied BOUND type is not accepted, found: {sorted(ALLOWED_BOUNDS)}"
+    )
 
-    if col_id in parsed_data['BOUNDS']:
+    existing = parsed_data['BOUNDS'].get(col_id)
+    if existing is not None:
         if (
-            ('upper' in parsed_data['BOUNDS'][col_id] and bound_type == 'UP') or
-            ('lower' in parsed_data['BOUNDS'][col_id] and bound_type == 'LO') or
+            ('upper' in existing and bound_type == 'UP') or
+            ('lower' in existing and bound_type == 'LO') or
             (bound_type in ['FX', 'MI', 'PL', 'FR'])
         ):
             raise ValueError(f"BOUND on COLUMN {col_id} specified twice!")
 
-    if not 'BOUNDS_id' in parsed_data or bound_id == parsed_data['BOUNDS_id']:
-        parsed_data['BOUNDS_id'] = bound_id
-    else:
+    # the first BOUNDS vector seen is the one kept
+    if parsed_data.setdefault('BOUNDS_id', bound_id) != bound_id:
         if verbose:
-            print(
-                f'More than one BOUND vector specified, skipping {bound_id}.')
-        return parsed_data
-
-    if bound_type == 'UP':
-        COUNTS['UP'] += 1
-        parsed_data['BOUNDS'][col_id]['upper'] = bound_val
-    elif bound_type == 'LO':
-        COUNTS['LO'] += 1
-        parsed_data['BOUNDS'][col_id]['lower'] = bound_val
-    elif bound_type == 'FX':
-        COUNTS['FX'] += 1
-        parsed_data['BOUNDS'][col_id]['upper'] = bound_val
-        parsed_data['BOUNDS'][col_id]['lower'] = bound_val
-    elif bound_type == 'FR':
-        COUNTS['FR'] += 1
-        if verbose and bound_val != None:
-            print(f"BOUNDS value of {bound_val} on {col_id} was ignored")
-        parsed_data['BOUNDS'][col_id]['upper'] = np.Inf
-        parsed_data['BOUNDS'][col_id]['lower'] = np.NINF
-    elif bound_type == 'MI':
-        COUNTS['MI'] += 1
-        if verbose and bound_val != None:
-            print(f"BOUNDS value of {bound_val} on {col_id} was ignored")
-        parsed_data['BOUNDS'][col_id]['lower'] = np.NINF
-        # upper bound cannot be assumed to be 0
-    elif bound_type == 'PL':
-        COUNTS['PL'] += 1
-        if verbose and bound_val != None:
-            print(f"BOUNDS value of {bound_val} on {col_id} was ignored")
-        parsed_data['BOUNDS'][col_id]['upper'] = np.Inf
-        parsed_data['BOUNDS'][col_id]['lower'] = 0
+            log.info('More than one BOUND vector specified, skipping %s.', bound_id)
+        return
+
+    COUNTS[bound_type] += 1
+    _BOUND_DISPATCH[bound_type](
+        parsed_data['BOUNDS'][col_id], col_id, bound_val, verbose)
+
+
+def _apply_up(bound, col_id, bound_val, verbose):
+    '''UP bound, sets the upper bound to bound_val'''
+    bound['upper'] = bound_val
 
-    return parsed_data
+
+def _apply_lo(bound, col_id, bound_val, verbose):
+    '''LO bound, sets the lower bound to bound_val'''
+    bound['lower'] = bound_val
+
+
+def _apply_fx(bound, col_id, bound_val, verbose):
+    '''FX bound, sets the upper & lower bound to bound_val'''
+    bound['upper'] = bound_val
+    bound['lower'] = bound_val
+
+
+def _apply_fr(bound, col_id, bound_val, verbose):
+    '''FR bound, sets the lower bound to -INF and upper to INF'''
+    if verbose and bound_val != None:
+        log.info("BOUNDS value of %s on %s was ignored", bound_val, col_id)
+    bound['upper'] = _POS_INF
+    bound['lower'] = _NEG_INF
+
+
+def _apply_mi(bound, col_id, bound_val, verbose):
+    '''MI bound, sets the lower bound to -INF'''
+    if verbose and bound_val != None:
+        log.info("BOUNDS value of %s on %s was ignored", bound_val, col_id)
+    bound['lower'] = _NEG_INF
+    # upper bound cannot be assumed to be 0
+
+
+def _apply_pl(bound, col_id, bound_val, verbose):
+    '''PL bound, sets the upper bound to INF'''
+    if verbose and bound_val != None:
+        log.info("BOUNDS value of %s on %s was ignored", bound_val, col_id)
+    bound['upper'] = _POS_INF
+    bound['lower'] = 0
+
+
+# bound type handlers used by add_bound(), one per ALLOWED_BOUNDS type; each one
+# updates the {'upper': ..., 'lower': ...} dict of the bounded column
+_BOUND_DISPATCH = {
+    'UP': _apply_up,
+    'LO': _apply_lo,
+    'FX': _apply_fx,
+    'FR': _apply_fr,
+    'MI': _apply_mi,
+    'PL': _apply_pl
+}
 
 
 def add_rhs(data, parsed_data, verbose):
@@ -1023,40 +1480,79 @@ def add_rhs(data, parsed_data, verbose):
     -------
     data (list) - split line for data indicator
     parsed_data (dict) - current state of all parsed data, must have 'RHS' key
-    verbose (bool) - if True, print out statement about ignored RHS vector.
+    verbose (bool) - if True, log a statement about ignored RHS vector.
 
-    Yield:
-    ------
-    updated parsed_data['RHS'] section in form of OrderedDict(): {row_id: row_val, ...} as well
+    Updates:
+    --------
+    parsed_data['RHS'] section in form of dict: {row_id: row_val, ...} as well
     as a parsed_data['RHS_id'] which is used to match the RANGES
     '''
 
-    rhs_id, row_data = parse_wrap_cols(data, 'RHS')
+    add_rhs_records([data], parsed_data, verbose)
 
-    # only keep first RHS vector
-    if not 'RHS_id' in parsed_data or rhs_id == parsed_data['RHS_id']:
-        parsed_data['RHS_id'] = rhs_id
-    else:
-        if verbose:
-            print(
-                f'More than one RHS vector specified, skipping RHS {rhs_id}.')
-        return parsed_data
 
-    # add data to parsed_data
-    for row_id, row_val in row_data:
+def add_rhs_records(records, parsed_data, verbose):
+    '''
+    Parse a batch of RHS data indicator lines; same as calling add_rhs() on each of them,
+    except that all of the RHS values are converted to floats in one vectorized pass.
 
-        try:
-            row_val = make_numeric(row_val)
-        except:
-            raise ValueError(f"RHS value must be a float, found: {row_val}")
+    Params:
+    -------
+    records (list) - split lines for the RHS data indicator
+    parsed_data (dict) - current state of all parsed data, must have 'RHS' key
+    verbose (bool) - if True, log a statement about ignored RHS vector.
 
-        assert not row_id in parsed_data['RHS'], f'RHS for {row_id} specified twice!'
-        parsed_data['RHS'][row_id] = row_val
+    Updates:
+    --------
+    parsed_data['RHS'] section, see add_rhs()
+    '''
 
-    return parsed_data
+    # split the records into flat id/value lists, the same way as parse_wrap_cols(): a
+    # record is [row_id, row_val] optionally followed by [row_id, row_val], and may be
+    # preceded by the RHS vector id
+    row_ids, row_vals = [], []
+    malformed = None
+    for data in records:
+        n = len(data)
+        if not 2 <= n <= 5:
+            # reported once the records before it are added, so that errors are raised in
+            # record order
+            malformed = data
+            break
+
+        if n & 1:
+            rhs_id, first = data[0], 1
+        else:
+            rhs_id, first = None, 0
+
+        # only keep first RHS vector
+        if parsed_data.setdefault('RHS_id', rhs_id) != rhs_id:
+            if verbose:
+                log.info('More than one RHS vector specified, skipping RHS %s.', rhs_id)
+            continue
+
+        row_ids += data[first::2]
+        row_vals += data[first + 1::2]
 
+    try:
+        row_vals = list(map(float, row_vals))
+    except ValueError:
+        # FORTRAN formats (e.g. 1D-3) or a bad value, convert one by one while adding
+        # them below
+        row_vals = _numerics(row_vals, 'RHS')
 
-def add_col(data, parsed_data):
+    # add data to parsed_data
+    rhs = parsed_data['RHS']
+    for row_id, row_val in zip(row_ids, row_vals):
+        assert not row_id in rhs, f'RHS for {row_id} specified twice!'
+        rhs[sys.intern(row_id)] = row_val
+
+    assert malformed is None, (
+        f"RHS data record must only contain 2, 3, 4 or 5 fields, found: {malformed}"
+    )
+
+
+def add_col(data, parsed_data, verbose=False):
     '''
     Parse a COLUMN data indicator line. Will assert that:
       - only 3 or 5 fields are available
@@ -1067,34 +1563,90 @@ def add_col(data, parsed_data):
     -------
     data (list) - split line for data indicator
     parsed_data (dict) - current state of all parsed data, must have 'COLUMNS' key
+    verbose (bool, default False) - unused, accepted so that all add_* functions share
+        the same signature
 
-    Yield:
-    ------
-    updated parsed_data['COLUMNS'] section in form of Dict():
+    Updates:
+    --------
+    parsed_data['COLUMNS'] section in form of Dict():
         {col_id: [{row_id, row_val}], ...}
     '''
 
-    col_id, row_data = parse_wrap_cols(data, 'COLUMNS')
+    add_cols([data], parsed_data, verbose)
+
+
+def add_cols(records, parsed_data, verbose=False):
+    '''
+    Parse a batch of COLUMN data indicator lines; same as calling add_col() on each of them,
+    except that all of the row values are converted to floats in one vectorized pass.
+
+    Params:
+    -------
+    records (list) - split lines for the COLUMNS data indicator
+    parsed_data (dict) - current state of all parsed data, must have 'COLUMNS' key
+    verbose (bool, default False) - unused, see add_col()
+
+    Updates:
+    --------
+    parsed_data['COLUMNS'] section, see add_col()
+    '''
+
+    # split the records into flat id/value lists, the same way as parse_wrap_cols(): a
+    # record is [col_id, row_id, row_val] optionally followed by [row_id, row_val]
+    # labels are interned so that every occurrence of a label shares one string
+    _i = sys.intern
+    add_column = parsed_data['ALL_COLUMNS'].add
+    row_ids, col_ids, row_vals = [], [], []
+    col_id = None
+    malformed = None
+    for data in records:
+        # the records of a column are grouped together, so a column label only
+        # needs interning/adding to ALL_COLUMNS when it changes
+        if data[0] != col_id:
+            col_id = _i(data[0])
+            add_column(col_id)
+
+        if len(data) == 5:
+            col_ids += (col_id, col_id)
+            row_ids += (_i(data[1]), _i(data[3]))
+            row_vals += (data[2], data[4])
+        elif len(data) == 3:
+            col_ids.append(col_id)
+            row_ids.append(_i(data[1]))
+            row_vals.append(data[2])
+        else:
+            # malformed record, reported once the records before it are added, so that
+            # errors are raised in record order
+            malformed = data
+            break
+
+    try:
+        row_vals = list(map(float, row_vals))
+    except ValueError:
+        # FORTRAN formats (e.g. 1D-3) or a bad value, convert one by one while adding
+        # them below
+        row_vals = _numerics(row_vals, 'ROW')
 
     # add data to parsed_data
-    for row_id, row_val in row_data:
+    columns = parsed_data['COLUMNS']
+    for row_id, col_id, row_val in zip(row_ids, col_ids, row_vals):
 
         try:
-            row_val = make_numeric(row_val)
-        except:
-            raise ValueError(f"ROW value must be a float, found: {row_val}")
-
-        if not row_id in parsed_data['COLUMNS']:
-            parsed_data['COLUMNS'][row_id] = {}
+            row = columns[row_id]
+        except KeyError:
+            # first coefficient in this row; a row that isn't in ROWS gets created
+            # too and is reported by conform_cols()
+            row = columns[row_id] = {}
 
-        assert not col_id in parsed_data['COLUMNS'][row_id], (
+        assert not col_id in row, (
             f"COLUMN {col_id} specified twice in ROW {row_id}!"
         )
 
-        parsed_data['COLUMNS'][row_id][col_id] = row_val
-        parsed_data['ALL_COLUMNS'].add(col_id)
+        row[col_id] = row_val
 
-    return parsed_data
+    if malformed is not None:
+        # raises the appropriate error
+        parse_wrap_cols(malformed, 'COLUMNS')
 
 
 def add_row(data, parsed_data, verbose):
@@ -1107,11 +1659,11 @@ def add_row(data, parsed_data, verbose):
     -------
     data (list) - split line for data indicator
     parsed_data (dict) - current state of all parsed data, must have 'ROWS' key
-    verbose (bool) - if True, print out statement about ignored objective rows.
+    verbose (bool) - if True, log a statement about ignored objective rows.
 
-    Yeild:
-    ------
-    updated parsed_data['ROWS'] section in form of OrderedDict():
+    Updates:
+    --------
+    parsed_data['ROWS'] section in form of dict:
         {row_name: sense}
     also adds a parsed_data['OBJ_ROW'] section which contains the name of the objective row
     '''
@@ -1119,25 +1671,24 @@ def add_row(data, parsed_data, verbose):
     assert len(
         data) == 2, f"ROW data record must only contain two fields, found: {data}."
 
-    sense, row_name = data
+    sense, row_name = data[0], sys.intern(data[1])
 
-    assert sense in ALLOWED_ROW_SENSE, f'ROW sense indidcator must be one of {ALLOWED_ROW_SENSE}'
+    assert sense in ALLOWED_ROW_SENSE, (
+        f'ROW sense indidcator must be one of {sorted(ALLOWED_ROW_SENSE)}'
+    )
     assert not row_name in parsed_data['ROWS'], f"ROW name {row_name} is duplicated!"
 
     # If more than one free row (N) is specified, the first one is used as the objective
     # function and the others are discarded.
     if sense == 'N' and 'N' in parsed_data['ROWS'].values():
         if verbose:
-            print(f'Free row already specified, skipping data: {data}')
+            log.info('Free row already specified, skipping data: %s', data)
     else:
-        assert not row_name in parsed_data['ROWS'], f"ROW {row_name} already specified"
         parsed_data['ROWS'][row_name] = sense
 
         if sense == 'N':
             parsed_data['OBJ_ROW'] = row_name
 
-    return parsed_data
-
 
 def parse_line(l, current_indicator):
     '''
@@ -1167,22 +1718,25 @@ def parse_line(l, current_indicator):
 
     data, parts = None, None
 
-    # comment or blank line
-    if l[0] == '*' or l.strip() == '':
-        return None, None
+    first = l[0]
+
+    # comment or blank line, the indicator record carries on past it
+    if first == '*' or l.isspace():
+        return current_indicator, None
+
+    # split() drops the leading/trailing whitespace itself, no strip() needed
+    parts = l.split()
 
     # if on a indicator record (e.g. COLUMNS), update it
-    if l[0] != ' ':
-        parts = l.strip().split()
+    if first != ' ':
         indicator = parts[0]
 
         # if on NAME indicator, grab the name
-        if parts[0] == 'NAME':
+        if indicator == 'NAME':
             data = parts[1]
 
     # if on a data record
     else:
-        parts = l.split()
         indicator = current_indicator
         data = parts
 
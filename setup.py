@@ -18,13 +18,13 @@ setup(
     keywords=['netlib', 'linear programming'],
     url='https://github.com/simpleroseinc/pymps',
     long_description=localopen('README.md').read(),
-    install_requires=['numpy', 'pandas'],
+    install_requires=['numpy'],
+    python_requires='>=3.7',
     classifiers=[
         'Development Status :: 4 - Beta',
         'License :: Other/Proprietary License',
         'Operating System :: POSIX :: Linux',
         'Operating System :: MacOS :: MacOS X',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
     ]
 )
@@ -2,11 +2,32 @@ from .context import pymps as ppm
 
 import numpy as np
 import unittest
+import contextlib
 import copy
+import io
+import logging
 import os
 import json
 
 
+def _coo_to_nested(coo, row_labels, col_labels):
+    '''Rebuild nested {row: {col: coef}} COLUMNS from coordinate arrays'''
+    columns = {}
+    for i, j, v in zip(coo['row'], coo['col'], coo['val']):
+        columns.setdefault(row_labels[i], {})[col_labels[j]] = v
+    return columns
+
+
+def _csc_to_nested(csc):
+    '''Rebuild nested {row: {col: coef}} COLUMNS from columns_as_csc() output'''
+    columns = {}
+    for j, cl in enumerate(csc['col_labels']):
+        start, end = csc['col_ptr'][j], csc['col_ptr'][j + 1]
+        for i, v in zip(csc['row_indices'][start:end], csc['values'][start:end]):
+            columns.setdefault(csc['row_labels'][i], {})[cl] = v
+    return columns
+
+
 class BasicTestSuite(unittest.TestCase):
     """Basic test cases."""
 
@@ -18,6 +39,7 @@ class BasicTestSuite(unittest.TestCase):
         cls.mps2 = os.path.abspath('tests/data/example2.mps')
         cls.mps3 = os.path.abspath('tests/data/example3.mps')
         cls.mps4 = os.path.abspath('tests/data/example4.mps')
+        cls.mps5 = os.path.abspath('tests/data/example5.mps')
         cls.mps_errors1 = os.path.abspath('tests/data/bad_example1.mps')
         cls.mps_errors2 = os.path.abspath('tests/data/bad_example2.mps')
         cls.mps_errors3 = os.path.abspath('tests/data/bad_example3.mps')
@@ -27,6 +49,7 @@ class BasicTestSuite(unittest.TestCase):
         cls.mps_errors7 = os.path.abspath('tests/data/bad_example7.mps')
         cls.mps_errors8 = os.path.abspath('tests/data/bad_example8.mps')
         cls.mps_errors9 = os.path.abspath('tests/data/bad_example9.mps')
+        cls.mps_errors10 = os.path.abspath('tests/data/bad_example10.mps')
         expected_no_fill = {
             "NAME": "EXAMPLE",
             "ROWS": {
@@ -242,6 +265,39 @@ class BasicTestSuite(unittest.TestCase):
         dual = ppm.make_dual(mps)
         self.assertDictEqual(dual, self.parsed_dual3)
 
+    def test_make_dual_zeros(self):
+
+        # negating rows & columns leaves zero coefficients as 0.0, not -0.0
+        dual = ppm.make_dual(ppm.parse_mps(self.mps2, fill=True))
+        zeros = [v for cols in dual['COLUMNS'].values() for v in cols.values() if v == 0]
+        self.assertTrue(zeros)
+        self.assertFalse(any(np.signbit(zeros)))
+        self.assertNotIn(' -0.0\n', ppm.parsed_as_mps(dual))
+
+    def test_shift_var(self):
+
+        # shift variables directly on parse_mps() output
+        mps = ppm.parse_mps(self.dual2, fill=True)
+        # every row gets shifted, so the objective needs an RHS too (see make_dual())
+        mps['RHS'][mps['OBJ_ROW']] = 0
+        rhs = dict(mps['RHS'])
+        col = mps['ALL_COLUMNS'][0]
+        coefs = {rl: mps['COLUMNS'][rl][col] for rl in mps['ROWS']}
+
+        ppm.shift_var(mps, col, 2.0, 'FX')
+        self.assertNotIn(col, mps['ALL_COLUMNS'])
+        for rl, coef in coefs.items():
+            self.assertNotIn(col, mps['COLUMNS'][rl])
+            self.assertEqual(mps['RHS'][rl], rhs[rl] - 2.0 * coef)
+
+        col = mps['ALL_COLUMNS'][0]
+        coefs = {rl: mps['COLUMNS'][rl][col] for rl in mps['ROWS']}
+        rhs = dict(mps['RHS'])
+        ppm.shift_var(mps, col, 3.0, 'UP')
+        for rl, coef in coefs.items():
+            self.assertEqual(mps['COLUMNS'][rl][col], -coef)
+            self.assertEqual(mps['RHS'][rl], rhs[rl] - 3.0 * coef)
+
     def test_parsed_as_mps(self):
 
         self.maxDiff = None
@@ -254,16 +310,128 @@ class BasicTestSuite(unittest.TestCase):
 
         self.assertEqual(dual_mps, dat)
 
+        # stream into a file-like object instead of returning a str
+        buf = io.StringIO()
+        self.assertIsNone(ppm.parsed_as_mps(dual, out=buf))
+        self.assertEqual(buf.getvalue(), dual_mps)
+
     def test_parse_mps_no_fill(self):
 
         mps = ppm.parse_mps(self.mps, fill=False)
         self.assertDictEqual(mps, self.parsed_mps_no_fill)
 
+        # data records after ENDATA are ignored
+        mps = ppm.parse_mps(self.mps5, fill=False)
+        self.assertDictEqual(mps, self.parsed_mps_no_fill)
+
+    def test_parse_line_comment(self):
+
+        # comments and blank lines don't end the current indicator record
+        self.assertEqual(
+            ppm.parse_line('* comment\n', 'COLUMNS'), ('COLUMNS', None))
+        self.assertEqual(ppm.parse_line('\n', 'RHS'), ('RHS', None))
+
     def test_parse_mps_fill(self):
 
         mps = ppm.parse_mps(self.mps, fill=True)
         self.assertDictEqual(mps['ROWS'], self.parsed_mps_fill['ROWS'])
 
+    def test_parse_mps_arrays(self):
+
+        mps = ppm.parse_mps_arrays(self.mps, fill=False)
+        expected = copy.deepcopy(self.parsed_mps_no_fill)
+
+        columns = _coo_to_nested(
+            mps.pop('COEFFICIENTS'), list(mps['ROWS']), mps['ALL_COLUMNS'])
+        self.assertDictEqual(columns, expected.pop('COLUMNS'))
+        self.assertDictEqual(mps, expected)
+
+        # reference non-existant row
+        with self.assertRaises(AssertionError) as context:
+            mps = ppm.parse_mps_arrays(self.mps_errors7)
+        self.assertEqual(
+            "COLUMNS makes reference to non-existant ROW(s) {'R05'}!",
+            str(context.exception)
+        )
+
+        # coefficient specified twice, reported like parse_mps() does
+        for parse in [ppm.parse_mps, ppm.parse_mps_arrays]:
+            with self.assertRaises(AssertionError) as context:
+                parse(self.mps_errors10)
+            self.assertEqual(
+                "COLUMN C02 specified twice in ROW R03!", str(context.exception))
+
+    def test_columns_as_csc(self):
+
+        for mps in [ppm.parse_mps(self.mps), ppm.parse_mps_arrays(self.mps)]:
+            csc = ppm.columns_as_csc(mps)
+            self.assertEqual(csc['col_ptr'][-1], len(csc['values']))
+
+            self.assertDictEqual(
+                _csc_to_nested(csc), self.parsed_mps_no_fill['COLUMNS'])
+
+            csc32 = ppm.columns_as_csc(mps, dtype=np.float32)
+            self.assertEqual(csc32['values'].dtype, np.float32)
+            np.testing.assert_allclose(csc32['values'], csc['values'], rtol=1e-6)
+
+        # make_dual() output has no ALL_COLUMNS
+        dual = ppm.make_dual(ppm.parse_mps(self.dual2, fill=True))
+        self.assertDictEqual(
+            _csc_to_nested(ppm.columns_as_csc(dual)), dual['COLUMNS'])
+
+    def test_records_error_order(self):
+
+        # within a batch of records, errors are raised in record order
+        def cols():
+            return {'COLUMNS': {}, 'ALL_COLUMNS': set()}
+
+        with self.assertRaises(AssertionError) as context:
+            ppm.add_cols([['X1', 'COST', '1'], ['X1', 'COST', '2'], ['X2', 'R1', 'abc']],
+                         cols())
+        self.assertEqual(
+            "COLUMN X1 specified twice in ROW COST!", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            ppm.add_cols([['X1', 'R1', 'abc'], ['X2', 'R1']], cols())
+        self.assertEqual(
+            "ROW value must be a float, found: abc", str(context.exception))
+
+        with self.assertRaises(AssertionError) as context:
+            ppm.add_rhs_records([['RHS', 'R1', '1'], ['RHS', 'R1', '2'], ['RHS', 'R2', 'abc']],
+                                {'RHS': {}}, False)
+        self.assertEqual("RHS for R1 specified twice!", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            ppm.add_rhs_records([['RHS', 'R1', 'abc'], ['RHS']], {'RHS': {}}, False)
+        self.assertEqual(
+            "RHS value must be a float, found: abc", str(context.exception))
+
+    def test_parse_mps_verbose(self):
+
+        with self.assertLogs('pymps', level='INFO') as context:
+            ppm.parse_mps(self.mps, verbose=True, fill=True)
+        # conform_bounds() goes through the columns in set order
+        self.assertCountEqual(context.output, [
+            "INFO:pymps:Free row already specified, skipping data: ['N', 'COST2']",
+            'INFO:pymps:More than one RHS vector specified, skipping RHS B2.',
+            'INFO:pymps:Upper bound unspecified for C03, setting it to +Inf.',
+            'INFO:pymps:Lower bound unspecified for C01, setting it to -Inf'
+        ])
+
+        # without verbose, nothing is logged
+        with self.assertRaises(AssertionError):
+            with self.assertLogs('pymps', level='INFO'):
+                ppm.parse_mps(self.mps, fill=True)
+
+        # messages go to the current sys.stdout, like print()
+        handler = ppm._StdoutHandler()
+        record = logging.makeLogRecord({'msg': 'message'})
+        for _ in range(2):
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                handler.emit(record)
+            self.assertEqual(buf.getvalue(), 'message\n')
+
     def test_parse_mps_bounds(self):
 
         # test bounds where LO is omitted and UP is either <0 or >0